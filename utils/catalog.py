@@ -0,0 +1,160 @@
+from typing import Dict, List, Optional, Any
+import polars as pl
+import fastexcel
+import hashlib
+import glob
+import json
+import os
+import re
+import tempfile
+
+
+class FileCatalog:
+    """Catálogo de archivos de entrada con metadatos del examen guardados en un manifiesto local."""
+
+    PATRON_NOMBRE = re.compile(r'^Resultados-UNICA-(?P<anio>\d{4})(?:-(?P<periodo>[A-Z]+))?\.xlsx$', re.IGNORECASE)
+    PATRON_GLOB = re.compile(r'[*?[]')
+    NOMBRE_MANIFIESTO = '.catalogo.json'
+    FILAS_MUESTRA = 20
+
+    @staticmethod
+    def parse_filename(filepath: str) -> Optional[Dict[str, Any]]:
+        """Extrae año y periodo del nombre 'Resultados-UNICA-YYYY-P.xlsx'; devuelve None si no coincide."""
+        match = FileCatalog.PATRON_NOMBRE.match(os.path.basename(filepath))
+        if match is None:
+            return None
+        periodo = match.group('periodo')
+        return {
+            'anio': int(match.group('anio')),
+            'periodo': periodo.upper() if periodo else None
+        }
+
+    @staticmethod
+    def base_dir(path_pattern: str) -> str:
+        """Devuelve el directorio real más largo del patrón, antes del primer componente con comodines."""
+        directorio = os.path.dirname(path_pattern)
+        if not directorio:
+            return '.'
+        partes = []
+        for parte in directorio.split(os.sep):
+            if FileCatalog.PATRON_GLOB.search(parte):
+                break
+            partes.append(parte)
+        if partes == ['']:
+            return os.sep
+        return os.sep.join(partes) or '.'
+
+    @staticmethod
+    def manifest_path(path_pattern: str) -> str:
+        """Devuelve la ruta del manifiesto, ubicado en el directorio base del patrón."""
+        return os.path.join(FileCatalog.base_dir(path_pattern), FileCatalog.NOMBRE_MANIFIESTO)
+
+    @staticmethod
+    def _hash_file(filepath: str) -> str:
+        """Calcula el hash SHA-256 del archivo leyéndolo por bloques."""
+        sha = hashlib.sha256()
+        with open(filepath, 'rb') as fh:
+            for bloque in iter(lambda: fh.read(1 << 20), b''):
+                sha.update(bloque)
+        return sha.hexdigest()
+
+    @staticmethod
+    def _detect_scale(muestra: pl.DataFrame) -> Optional[str]:
+        """Deduce la escala de puntaje ('0-20' o '0-2000') a partir de las filas de muestra."""
+        if 'puntaje' not in muestra.columns:
+            return None
+        maximo = muestra.select(pl.col('puntaje').cast(pl.Float64, strict=False).max()).item()
+        if maximo is None:
+            return None
+        return '0-2000' if maximo > 20 else '0-20'
+
+    @staticmethod
+    def _inspect_file(filepath: str) -> Dict[str, Any]:
+        """Lee una sola vez el encabezado y unas pocas filas para obtener filas, columnas y escala."""
+        hoja = fastexcel.read_excel(filepath).load_sheet(0, n_rows=FileCatalog.FILAS_MUESTRA)
+        muestra = hoja.to_polars()
+        return {
+            'filas': hoja.total_height,
+            'columnas': muestra.columns,
+            'escala': FileCatalog._detect_scale(muestra)
+        }
+
+    @staticmethod
+    def load_manifest(manifest_path: str) -> Dict[str, Dict[str, Any]]:
+        """Carga el manifiesto desde disco; devuelve un diccionario vacío si no existe o está dañado."""
+        if not os.path.exists(manifest_path):
+            return {}
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def save_manifest(manifest: Dict[str, Dict[str, Any]], manifest_path: str) -> None:
+        """Guarda el manifiesto en disco, escribiendo primero a un archivo temporal único."""
+        fd, tmp_path = tempfile.mkstemp(prefix=FileCatalog.NOMBRE_MANIFIESTO, suffix='.tmp',
+                                        dir=os.path.dirname(manifest_path) or '.')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                json.dump(manifest, fh, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, manifest_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def build(path_pattern: str, manifest_path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Construye o actualiza el catálogo; solo vuelve a inspeccionar los archivos modificados."""
+        base = FileCatalog.base_dir(path_pattern)
+        manifest_path = manifest_path or FileCatalog.manifest_path(path_pattern)
+        anterior = FileCatalog.load_manifest(manifest_path)
+        catalogo = {}
+
+        for f in sorted(glob.glob(path_pattern)):
+            meta = FileCatalog.parse_filename(f)
+            if meta is None:
+                continue
+            # Clave relativa al directorio base: evita colisiones entre archivos homónimos
+            clave = os.path.relpath(f, base)
+            stat = os.stat(f)
+            previo = anterior.get(clave)
+
+            # Mismo tamaño y fecha de modificación: se reutiliza la entrada sin abrir el archivo
+            if previo and previo.get('tamano') == stat.st_size and previo.get('mtime') == stat.st_mtime:
+                catalogo[clave] = {**previo, 'ruta': f}
+                continue
+
+            hash_archivo = FileCatalog._hash_file(f)
+            if previo and previo.get('hash') == hash_archivo:
+                info = {k: previo[k] for k in ('filas', 'columnas', 'escala')}
+            else:
+                info = FileCatalog._inspect_file(f)
+
+            catalogo[clave] = {
+                **meta,
+                **info,
+                'ruta': f,
+                'tamano': stat.st_size,
+                'mtime': stat.st_mtime,
+                'hash': hash_archivo
+            }
+
+        # El manifiesto es solo una caché: si no se puede escribir se sigue con el catálogo en memoria
+        if catalogo != anterior:
+            try:
+                FileCatalog.save_manifest(catalogo, manifest_path)
+            except OSError:
+                pass
+        return catalogo
+
+    @staticmethod
+    def select(catalogo: Dict[str, Dict[str, Any]], years: List[int],
+               periods: Optional[List[str]] = None) -> List[str]:
+        """Devuelve las rutas de los archivos cuyo año y periodo coinciden exactamente con los indicados."""
+        periodos = {p.upper() for p in periods} if periods is not None else None
+        return [
+            meta['ruta'] for _, meta in sorted(catalogo.items(), key=lambda x: (x[1]['anio'], x[1]['periodo'] or ''))
+            if meta['anio'] in years and (periodos is None or meta['periodo'] in periodos)
+        ]
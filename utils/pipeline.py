@@ -1,16 +1,19 @@
 from typing import List, Optional
 import polars as pl
-import glob
 import os
+from utils.catalog import FileCatalog
 from utils.mapeo import dict_modalidades, dict_carreras, dict_facultades, dict_area
 
 
 class FileETL:
 
     @staticmethod
-    def load_files(path_pattern: str, years: List[int]) -> pl.DataFrame:
-        """Carga y concatena todos los archivos Excel que coincidan con los años indicados."""
-        files = [f for f in glob.glob(path_pattern) if any(str(y) in f for y in years)]
+    def load_files(path_pattern: str, years: List[int], periods: Optional[List[str]] = None) -> pl.DataFrame:
+        """Carga y concatena los archivos Excel cuyo año (y periodo, si se indica) coinciden según el catálogo."""
+        catalogo = FileCatalog.build(path_pattern)
+        files = FileCatalog.select(catalogo, years, periods)
+        if not files:
+            raise FileNotFoundError(f"No hay archivos para los años {years} y periodos {periods} en {path_pattern}")
         df = pl.concat([
             pl.read_excel(f)
               .drop('facultad', strict=False)
@@ -142,9 +145,9 @@ class FileETL:
         df.to_pandas().to_excel(filepath, index=False, na_rep="")
 
     @staticmethod
-    def run_pipeline(path_pattern: str, years: List[int]) -> pl.DataFrame:
+    def run_pipeline(path_pattern: str, years: List[int], periods: Optional[List[str]] = None) -> pl.DataFrame:
         """Ejecuta todo el pipeline y devuelve el DataFrame procesado."""
-        df = FileETL.load_files(path_pattern, years)
+        df = FileETL.load_files(path_pattern, years, periods)
         df = FileETL.rename_columns(df)
         df = FileETL.clean_dni(df)
         df = FileETL.clean_names(df)